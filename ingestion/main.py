@@ -3,6 +3,9 @@ import pandas as pd
 import logging
 import pubsub_utils
 import functions_framework
+import io
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dlt.sources.helpers import requests
 
 
 
@@ -11,6 +14,12 @@ logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(
 logging.info('Ingestion Script started ...')
 
 
+def fetch_csv(url):
+    logging.info(f'fetching data from {url}...')
+    response = requests.get(url)
+    response.raise_for_status()
+    return response.content
+
 @dlt.resource(table_name = 'orbital_satellites_data', write_disposition = 'replace', file_format = 'parquet')
 def load_satellites_data():
     urls = ['https://celestrak.com/NORAD/elements/gp.php?GROUP=active&FORMAT=csv', 
@@ -34,11 +43,12 @@ def load_satellites_data():
         'MEAN_ANOMALY': float,
     }
 
-    for index, url in enumerate(urls):
-        logging.info(f'fetching data from {url}...')
-        for chunk in pd.read_csv(url, chunksize = 100, dtype = dtypes):
-            chunk['TYPE'] = labels[index]
-            yield chunk
+    with ThreadPoolExecutor(max_workers = len(urls)) as executor:
+        futures = {executor.submit(fetch_csv, url): label for url, label in zip(urls, labels)}
+        for future in as_completed(futures):
+            for chunk in pd.read_csv(io.BytesIO(future.result()), chunksize = 10000, dtype = dtypes):
+                chunk['TYPE'] = futures[future]
+                yield chunk
 
 @functions_framework.http
 def main(request):
@@ -3,7 +3,7 @@ import pandas_gbq
 import logging
 import numpy as np
 import pandas as pd
-from physics import get_position
+from physics import get_positions
 from sat_utils import orbit_classifier, launch_year, get_owner
 import base64
 import functions_framework
@@ -11,6 +11,12 @@ import functions_framework
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
+TRAJECTORY_SCHEMA = [{'name': 'Trajectory', 'type': 'RECORD', 'mode': 'REPEATED', 'fields': [
+    {'name': 'timestamp', 'type': 'STRING'},
+    {'name': 'lat', 'type': 'FLOAT'},
+    {'name': 'lon', 'type': 'FLOAT'},
+]}]
+
 @functions_framework.cloud_event
 def main(cloud_event): 
     try:
@@ -43,9 +49,7 @@ def main(cloud_event):
 
             logging.info(f'Propagating trajectories for payloads (24h horizon)...')
 
-            trajectoryPath= [get_position(row) for row in records]
-
-            trajectoryList, altitudeList = zip(*trajectoryPath)
+            trajectoryList, altitudeList = get_positions(records)
 
             logging.info('Physics engine complete')
 
@@ -81,7 +85,8 @@ def main(cloud_event):
 
             logging.info('Uploading to BigQuery (transformed_orbital_satellites_data)...')
 
-            pandas_gbq.to_gbq(dfTransformed, f'{bigquery_dataset}.transformed_orbital_satellites_data', project_id = project_id, if_exists = 'replace')
+            pandas_gbq.to_gbq(dfTransformed, f'{bigquery_dataset}.transformed_orbital_satellites_data', project_id = project_id, if_exists = 'replace',
+            table_schema = TRAJECTORY_SCHEMA)
 
             logging.info('Transformation Script finished successfully')
         
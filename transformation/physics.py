@@ -1,5 +1,8 @@
-from skyfield.api import load, wgs84
-from skyfield.sgp4lib import EarthSatellite
+from skyfield.api import load
+from skyfield.framelib import itrs
+from skyfield.sgp4lib import TEME
+from sgp4.api import Satrec, SatrecArray, jday
+from sgp4 import omm
 import numpy as np
 from datetime import datetime, timezone
 
@@ -15,27 +18,68 @@ minutes = np.arange(0, 1440, 10)
 
 timeVector = start_time + (minutes / 1440.0)
 
-def get_position(sat_data):
+timestamp_strs = [str(t) for t in timeVector.utc_datetime()]
 
-    satellite = EarthSatellite.from_omm(ts, sat_data)
+# SGP4 takes the OMM epoch as UTC, so the propagation grid is midnight UTC plus the 10-minute offsets
 
-    geocentric = satellite.at(timeVector)
-    
-    geo_pos = wgs84.geographic_position_of(geocentric)
+jd_midnight, fr_midnight = jday(midnight.year, midnight.month, midnight.day, 0, 0, 0)
 
-    lats = geo_pos.latitude.degrees
+jdVector = np.full(len(minutes), jd_midnight)
 
-    lons = geo_pos.longitude.degrees
+frVector = fr_midnight + (minutes / 1440.0)
 
-    alts = geo_pos.elevation.km
+# TEME -> ITRS rotation for every timestep, shared by all satellites: (3, 3, n_times)
 
-    path = []
+temeToItrs = np.einsum('ijt,kjt->ikt', itrs.rotation_at(timeVector), TEME.rotation_at(timeVector))
 
-    for t_obj, lat, lon in zip(timeVector, lats, lons):
-        path.append({
-            'timestamp': str(t_obj.utc_datetime()), 
-            'lat': round(float(lat), 2),
-            'lon': round(float(lon), 2),
-        })
+WGS84_RADIUS_KM = 6378.137
 
-    return path, np.mean(alts)
\ No newline at end of file
+WGS84_FLATTENING = 1 / 298.257223563
+
+WGS84_E2 = 2 * WGS84_FLATTENING - WGS84_FLATTENING * WGS84_FLATTENING
+
+def geodetic_from_itrs(xyz):
+
+    x, y, z = xyz[..., 0], xyz[..., 1], xyz[..., 2]
+
+    R = np.sqrt(x * x + y * y)
+
+    lat = np.arctan2(z, R)
+
+    for _ in range(3):
+        e2_sin_lat = WGS84_E2 * np.sin(lat)
+        aC = WGS84_RADIUS_KM / np.sqrt(1.0 - e2_sin_lat * np.sin(lat))
+        hyp = z + aC * e2_sin_lat
+        lat = np.arctan2(hyp, R)
+
+    lon = (np.arctan2(y, x) - np.pi) % (2 * np.pi) - np.pi
+
+    alt = np.sqrt(hyp * hyp + R * R) - aC
+
+    return np.degrees(lat), np.degrees(lon), alt
+
+def get_positions(records):
+
+    satellites = []
+
+    for sat_data in records:
+        satellite = Satrec()
+        omm.initialize(satellite, sat_data)
+        satellites.append(satellite)
+
+    errors, positions, velocities = SatrecArray(satellites).sgp4(jdVector, frVector)
+
+    itrsPositions = np.einsum('ijt,ntj->nti', temeToItrs, positions)
+
+    lats, lons, alts = geodetic_from_itrs(itrsPositions)
+
+    lats_r = np.round(lats, 2).tolist()
+
+    lons_r = np.round(lons, 2).tolist()
+
+    paths = [
+        [{'timestamp': ts_str, 'lat': lat, 'lon': lon} for ts_str, lat, lon in zip(timestamp_strs, sat_lats, sat_lons)]
+        for sat_lats, sat_lons in zip(lats_r, lons_r)
+    ]
+
+    return paths, alts.mean(axis = 1).tolist()
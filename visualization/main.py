@@ -1,8 +1,9 @@
 import dash
-from dash import dcc, html, Input, Output, callback, State, ctx
+from dash import dcc, html, Input, Output, callback, State
 import dash_bootstrap_components as dbc
 import plotly.express as px
 import plotly.graph_objects as go
+from plotly.utils import PlotlyJSONEncoder
 import pandas as pd
 import pandas_gbq
 import json
@@ -10,10 +11,15 @@ import os
 import logging
 import io
 import numpy as np
+import orjson
+import pyarrow as pa
+import pyarrow.compute as pc
 import threading
+from concurrent.futures import ThreadPoolExecutor
 import gc
+import functools
 from datetime import datetime, timezone
-from google.cloud import storage
+from google.cloud import bigquery, storage
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
@@ -23,19 +29,48 @@ BIGQUERY_DATASET = os.environ.get('BIGQUERY_DATASET')
 GCS_BUCKET_NAME = os.environ.get('GCS_BUCKET_NAME')
 
 logging.info(f"Config: PROJECT_ID={PROJECT_ID}, BIGQUERY_DATASET={BIGQUERY_DATASET}, GCS_BUCKET_NAME={GCS_BUCKET_NAME}")
-CACHE_FILENAME = 'orbital_data_cache_v2.parquet'
+CACHE_FILENAME = 'orbital_data_cache_v3.parquet'
+TRAJ_CACHE_FILENAME = 'orbital_traj_cache_v4.npz'
 KPI_CACHE_FILENAME = 'orbital_kpi_cache.parquet'
 
 
 df_main = None
 kpi_data = None
-timestamps = None
 search_options = []
 _traj_lat = None
 _traj_lon = None
-_cached_figures = {}
+_figures_json = '{}'
+_name_to_rows = {}
+_NO_ROWS = np.array([], dtype=np.intp)
+_globe_marker = {}
+_globe_hover = []
+
+ORBIT_COLORS = {'LEO': '#10b981', 'MEO': '#3b82f6', 'GEO': '#ef4444'}
+DEFAULT_ORBIT_COLOR = '#eab308'
+SEARCH_MARKER = {'size': 20, 'color': '#FFD700', 'opacity': 1.0}
+
+# the globe figure is returned as a plain dict, so resolve the template once here instead of validating per callback
+GLOBE_LAYOUT = go.Figure(layout=dict(
+    geo=dict(
+        projection_type="orthographic", 
+        showland=True, landcolor="#111111", 
+        showocean=True, oceancolor="#222222", 
+        showcountries=True, countrycolor="#444444",
+        bgcolor="rgba(0,0,0,0)"
+    ), 
+    title=dict(text="<b>Globe Overview</b>", x=0.02, y=0.95, font=dict(color="black", size=20)),
+    margin={"r":0,"t":50,"l":0,"b":0}, 
+    paper_bgcolor="rgba(0,0,0,0)", 
+    template="plotly_dark"
+)).to_plotly_json()['layout']
+
+TRAJECTORY_TYPE = pa.list_(pa.struct([('timestamp', pa.string()), ('lat', pa.float64()), ('lon', pa.float64())]))
+
+COORD_SCALE = 100
+COORD_MISSING = np.iinfo(np.int16).min
 
 data_lock = threading.Lock()
+_gcs_writer = ThreadPoolExecutor(max_workers=1)
 
 def optimize_dataframe_memory(df):
     for col in ['Object_Name', 'Owner', 'Orbit', 'Object_Type']:
@@ -53,52 +88,120 @@ def optimize_dataframe_memory(df):
             df[col] = df[col].astype('int32')
     return df
 
-def extract_trajectories_to_arrays(df):
-    n_rows = len(df)
+def parse_trajectory_json(traj_json):
+    if traj_json is None: return None
+    try:
+        traj = orjson.loads(traj_json)
+    except orjson.JSONDecodeError:
+        try:
+            # decayed objects propagate to NaN, which orjson rejects but stdlib json accepts
+            traj = json.loads(traj_json)
+        except ValueError:
+            return None
+    if not isinstance(traj, list) or not all(isinstance(pt, dict) for pt in traj):
+        return None
+    return traj
+
+def extract_trajectories_to_arrays(table):
     n_timestamps = 144 
     
-    lat_array = np.zeros((n_rows, n_timestamps), dtype=np.float32)
-    lon_array = np.zeros((n_rows, n_timestamps), dtype=np.float32)
+    traj = table.column('Trajectory').combine_chunks()
+    if pa.types.is_string(traj.type) or pa.types.is_large_string(traj.type):
+        traj = pa.array([parse_trajectory_json(t) for t in traj.to_pylist()], type=TRAJECTORY_TYPE)
     
-    for i, traj in enumerate(df['Trajectory']):
-        if isinstance(traj, str):
-            traj = json.loads(traj)
-        steps = min(len(traj), n_timestamps)
-        for j in range(steps):
-            lat_array[i, j] = traj[j]['lat']
-            lon_array[i, j] = traj[j]['lon']
-            
-    df = df.drop(columns=['Trajectory'])
-    df['_traj_idx'] = np.arange(n_rows, dtype=np.int32)
-    return df, lat_array, lon_array
+    valid_traj = pc.equal(pc.fill_null(pc.list_value_length(traj), 0), n_timestamps)
+    n_dropped = len(traj) - (pc.sum(valid_traj).as_py() or 0)
+    if n_dropped:
+        logging.warning(f"Dropping {n_dropped} objects with malformed trajectories")
+        table = table.filter(valid_traj)
+        traj = traj.filter(valid_traj)
+    
+    points = traj.flatten()
+    lat_array = points.field('lat').to_numpy(zero_copy_only=False).reshape(-1, n_timestamps)
+    lon_array = points.field('lon').to_numpy(zero_copy_only=False).reshape(-1, n_timestamps)
+    
+    df = table.drop_columns(['Trajectory']).to_pandas()
+    df['_traj_idx'] = np.arange(len(df), dtype=np.int32)
+    return df, quantize_coords(lat_array), quantize_coords(lon_array)
+
+def quantize_coords(coords):
+    scaled = np.round(coords * COORD_SCALE)
+    return np.where(np.isnan(scaled), COORD_MISSING, scaled).astype(np.int16)
+
+def dequantize_coords(coords_q):
+    coords = coords_q.astype(np.float32) / COORD_SCALE
+    coords[coords_q == COORD_MISSING] = np.nan
+    return coords
+
+def _precompute_marker_attributes():
+    global _name_to_rows, _globe_marker, _globe_hover
+    if df_main is None: return
+
+    df_main['Color'] = df_main['Orbit'].astype(str).map(ORBIT_COLORS).fillna(DEFAULT_ORBIT_COLOR)
+    df_main['HoverText'] = df_main['Object_Name'].astype(str) + ' (' + df_main['Owner'].astype(str) + ')'
+    df_main['Size'] = np.full(len(df_main), 2, dtype=np.int8)
+    df_main['Opacity'] = np.full(len(df_main), 0.7, dtype=np.float32)
+    _name_to_rows = df_main.groupby(df_main['Object_Name'].astype(str), observed=True).indices
+    _globe_marker = {'size': df_main['Size'].values, 'color': df_main['Color'].values, 'opacity': df_main['Opacity'].values}
+    _globe_hover = df_main['HoverText'].values
 
 def _precompute_static_figures():
-    global _cached_figures
+    global _figures_json
     if df_main is None: return
     
+    figures = {}
+    
     owner_counts = df_main['Owner'].value_counts().head(10).reset_index()
     owner_counts.columns = ['Owner', 'Count']
     fig_owners = px.bar(owner_counts, x='Count', y='Owner', orientation='h', text_auto=True)
     fig_owners.update_layout(template="plotly_white", title="<b>Owner Distribution</b>", height=600, margin={"r":20,"t":60,"l":20,"b":20})
     fig_owners.update_traces(marker_color='#3b82f6')
-    _cached_figures['owners'] = fig_owners
+    figures['owners'] = fig_owners
     
     df_alt = df_main[df_main['Avg_Altitude'] < 40000]
     fig_alt = px.histogram(df_alt, x="Avg_Altitude", nbins=50)
     fig_alt.update_layout(template="plotly_white", title="<b>Altitude Distribution (km)</b>", height=350, margin={"r":20,"t":50,"l":20,"b":20})
     fig_alt.update_traces(marker_color='#3b82f6')
-    _cached_figures['altitude'] = fig_alt
+    figures['altitude'] = fig_alt
     
     fig_inc = px.histogram(df_main, x="Inclination", nbins=50)
     fig_inc.update_layout(template="plotly_white", title="<b>Inclination Distribution (°)</b>", height=350, margin={"r":20,"t":50,"l":20,"b":20})
     fig_inc.update_traces(marker_color='#3b82f6')
-    _cached_figures['inclination'] = fig_inc
+    figures['inclination'] = fig_inc
     
     del df_alt
+    _figures_json = json.dumps(figures, cls=PlotlyJSONEncoder)
     gc.collect()
 
+def _persist_to_gcs(storage_client, df_save, traj_lat, traj_lon, df_kpi):
+    try:
+        logging.info("Saving to GCS Parquet...")
+        bucket = storage_client.bucket(GCS_BUCKET_NAME)
+        
+        buffer_traj = io.BytesIO()
+        np.savez_compressed(buffer_traj, lat=traj_lat, lon=traj_lon, cache_date=df_save['_cache_date'].iloc[0])
+        buffer_traj.seek(0)
+        bucket.blob(TRAJ_CACHE_FILENAME).upload_from_file(buffer_traj, content_type='application/octet-stream')
+        
+        buffer_kpi = io.BytesIO()
+        df_kpi.to_parquet(buffer_kpi, engine='pyarrow', compression='zstd')
+        buffer_kpi.seek(0)
+        bucket.blob(KPI_CACHE_FILENAME).upload_from_file(buffer_kpi, content_type='application/octet-stream')
+        
+        # the date-bearing object cache goes last so an interrupted upload never pairs it with stale blobs
+        buffer = io.BytesIO()
+        df_save.to_parquet(buffer, engine='pyarrow', compression='zstd')
+        buffer.seek(0)
+        bucket.blob(CACHE_FILENAME).upload_from_file(buffer, content_type='application/octet-stream')
+        
+        del df_save, buffer, buffer_traj, buffer_kpi
+        gc.collect()
+        logging.info("GCS Upload Complete.")
+    except Exception as e:
+        logging.error(f"Save to GCS failed: {e}")
+
 def load_data_smart():
-    global df_main, kpi_data, timestamps, search_options, _traj_lat, _traj_lon, _cached_figures
+    global df_main, kpi_data, search_options, _traj_lat, _traj_lon, _figures_json
     
     if df_main is not None: return 
 
@@ -114,9 +217,10 @@ def load_data_smart():
             try:
                 bucket = storage_client.bucket(GCS_BUCKET_NAME)
                 blob_main = bucket.blob(CACHE_FILENAME)
+                blob_traj = bucket.blob(TRAJ_CACHE_FILENAME)
                 blob_kpi = bucket.blob(KPI_CACHE_FILENAME)
 
-                if blob_main.exists() and blob_kpi.exists():
+                if blob_main.exists() and blob_traj.exists() and blob_kpi.exists():
                     logging.info(f"Downloading Parquet cache...")
                     
                     parquet_bytes = blob_main.download_as_bytes()
@@ -130,28 +234,31 @@ def load_data_smart():
                             logging.warning("Cache is stale. Refreshing from BigQuery...")
                             cache_valid = False
                     
+                    if cache_valid:
+                        traj_bytes = blob_traj.download_as_bytes()
+                        with np.load(io.BytesIO(traj_bytes)) as traj_npz:
+                            lat_temp = traj_npz['lat']
+                            lon_temp = traj_npz['lon']
+                            traj_date = str(traj_npz['cache_date']) if 'cache_date' in traj_npz.files else None
+                        del traj_bytes
+                        
+                        if traj_date != str(today_utc) or len(lat_temp) != len(df_temp):
+                            logging.warning("Trajectory cache does not match object cache. Refreshing from BigQuery...")
+                            cache_valid = False
+                    
                     if cache_valid:
                         df_main = df_temp
+                        _traj_lat, _traj_lon = lat_temp, lon_temp
                         
                         kpi_bytes = blob_kpi.download_as_bytes()
                         kpi_temp = pd.read_parquet(io.BytesIO(kpi_bytes))
                         kpi_data = kpi_temp.iloc[0].to_dict()
                         del kpi_bytes, kpi_temp
 
-                        n_ts = 144
-                        if 'lat_0' in df_main.columns:
-                            lat_cols = [f'lat_{i}' for i in range(n_ts)]
-                            lon_cols = [f'lon_{i}' for i in range(n_ts)]
-                            _traj_lat = df_main[lat_cols].values.astype(np.float32)
-                            _traj_lon = df_main[lon_cols].values.astype(np.float32)
-                            df_main = df_main.drop(columns=lat_cols + lon_cols)
-                        
                         df_main['_traj_idx'] = np.arange(len(df_main), dtype=np.int32)
                         
                         df_main = optimize_dataframe_memory(df_main)
                         
-                        timestamps = pd.date_range(start=pd.Timestamp(today_utc, tz='UTC'), periods=144, freq='10min')
-                        
                         loaded_from_gcs = True
                         logging.info(f"GCS Parquet Load Complete. Loaded {len(df_main)} objects, trajectory shape: {_traj_lat.shape}")
             except Exception as e:
@@ -164,51 +271,22 @@ def load_data_smart():
             logging.info("Downloading from BigQuery (Fallback)...")
             try:
                 q1 = f"SELECT * FROM `{BIGQUERY_DATASET}.transformed_orbital_satellites_data`"
-                df_raw = pandas_gbq.read_gbq(q1, project_id=PROJECT_ID)
-                
-                df_raw['Avg_Altitude'] = pd.to_numeric(df_raw['Avg_Altitude'], errors='coerce')
+                table_raw = bigquery.Client(project=PROJECT_ID).query(q1).to_arrow(create_bqstorage_client=True)
                 
-                if isinstance(df_raw['Trajectory'].iloc[0], str):
-                    first_traj = json.loads(df_raw['Trajectory'].iloc[0])
-                else:
-                    first_traj = df_raw['Trajectory'].iloc[0]
-                timestamps = pd.to_datetime([x['timestamp'] for x in first_traj], utc=True)
-                
-                df_main, _traj_lat, _traj_lon = extract_trajectories_to_arrays(df_raw)
-                del df_raw
+                df_main, _traj_lat, _traj_lon = extract_trajectories_to_arrays(table_raw)
+                del table_raw
                 gc.collect()
                 
+                df_main['Avg_Altitude'] = pd.to_numeric(df_main['Avg_Altitude'], errors='coerce')
                 df_main = optimize_dataframe_memory(df_main)
                 df_main['_cache_date'] = str(today_utc)
                 
                 q2 = f"SELECT * FROM `{BIGQUERY_DATASET}.orbital_kpis_view`"
-                df_kpi_temp = pandas_gbq.read_gbq(q2, project_id=PROJECT_ID)
+                df_kpi_temp = pandas_gbq.read_gbq(q2, project_id=PROJECT_ID, use_bqstorage_api=True)
                 kpi_data = df_kpi_temp.iloc[0].to_dict()
 
                 if GCS_BUCKET_NAME:
-                    try:
-                        logging.info("Saving to GCS Parquet...")
-                        df_save = df_main.copy()
-                        for i in range(144):
-                            df_save[f'lat_{i}'] = _traj_lat[:, i]
-                            df_save[f'lon_{i}'] = _traj_lon[:, i]
-                        
-                        buffer = io.BytesIO()
-                        df_save.to_parquet(buffer, engine='pyarrow', compression='snappy')
-                        buffer.seek(0)
-                        bucket = storage_client.bucket(GCS_BUCKET_NAME)
-                        bucket.blob(CACHE_FILENAME).upload_from_file(buffer, content_type='application/octet-stream')
-                        
-                        buffer_kpi = io.BytesIO()
-                        df_kpi_temp.to_parquet(buffer_kpi, engine='pyarrow', compression='snappy')
-                        buffer_kpi.seek(0)
-                        bucket.blob(KPI_CACHE_FILENAME).upload_from_file(buffer_kpi, content_type='application/octet-stream')
-                        
-                        del df_save, buffer, buffer_kpi
-                        gc.collect()
-                        logging.info("GCS Upload Complete.")
-                    except Exception as e:
-                        logging.error(f"Save to GCS failed: {e}")
+                    _gcs_writer.submit(_persist_to_gcs, storage_client, df_main.copy(), _traj_lat, _traj_lon, df_kpi_temp)
 
             except Exception as e:
                 logging.critical(f"BigQuery Load Failed: {e}")
@@ -216,13 +294,13 @@ def load_data_smart():
                 import traceback
                 logging.critical(traceback.format_exc())
                 df_main = pd.DataFrame({'Object_Name': ['No Data'], 'Owner': ['N/A'], 'Avg_Altitude': [0], 'Inclination': [0], '_traj_idx': [0], 'Orbit': ['LEO']})
-                _traj_lat = np.zeros((1, 144), dtype=np.float32)
-                _traj_lon = np.zeros((1, 144), dtype=np.float32)
+                _traj_lat = np.zeros((1, 144), dtype=np.int16)
+                _traj_lon = np.zeros((1, 144), dtype=np.int16)
                 kpi_data = {'Total_Objects': 0, 'Payload_Count': 0, 'Debris_Count': 0, 'Debris_Ratio_Pct': 0}
-                timestamps = pd.date_range(start=pd.Timestamp.now(tz='UTC'), periods=144, freq='10min')
 
         unique_names = df_main['Object_Name'].cat.categories if hasattr(df_main['Object_Name'], 'cat') else df_main['Object_Name'].unique()
         search_options = [{'label': str(name), 'value': str(name)} for name in sorted(unique_names)]
+        _precompute_marker_attributes()
         _precompute_static_figures()
 
 app = dash.Dash(__name__, external_stylesheets=[dbc.themes.LUX])
@@ -237,13 +315,9 @@ def warmup():
         return str(e), 500
 
 def get_current_time_index():
-    if timestamps is None or len(timestamps) == 0: return 0
     now_utc = pd.Timestamp.now(tz='UTC')
-    try:
-        time_diffs = np.abs((timestamps - now_utc).total_seconds())
-        return int(np.argmin(time_diffs))
-    except:
-        return 0
+    idx = int(round((now_utc - now_utc.normalize()).total_seconds() / 600))
+    return max(0, min(143, idx))
 
 def serve_layout():
     if df_main is None: load_data_smart()
@@ -281,24 +355,56 @@ def serve_layout():
         ], className="mb-4"),
         dbc.Row([
             dbc.Col([dbc.Card([dbc.CardBody(dcc.Graph(id='globe-map', style={"height": "600px"}), className="p-0")], className="shadow-sm border-0")], width=7),
-            dbc.Col([dbc.Card([dbc.CardBody(dcc.Graph(figure=_cached_figures.get('owners', go.Figure()), style={"height": "600px"}), className="p-0")], className="shadow-sm border-0")], width=5)
+            dbc.Col([dbc.Card([dbc.CardBody(dcc.Graph(id='owners-graph', style={"height": "600px"}), className="p-0")], className="shadow-sm border-0")], width=5)
         ], className="mb-4"),
         dbc.Row([
-            dbc.Col(dbc.Card(dcc.Graph(figure=_cached_figures.get('altitude', go.Figure())), className="shadow-sm border-0 p-1"), width=6),
-            dbc.Col(dbc.Card(dcc.Graph(figure=_cached_figures.get('inclination', go.Figure())), className="shadow-sm border-0 p-1"), width=6),
-        ])
+            dbc.Col(dbc.Card(dcc.Graph(id='altitude-graph'), className="shadow-sm border-0 p-1"), width=6),
+            dbc.Col(dbc.Card(dcc.Graph(id='inclination-graph'), className="shadow-sm border-0 p-1"), width=6),
+        ]),
+        dcc.Store(id='figures-store', data=_figures_json)
     ], style={"marginLeft": "22rem", "marginRight": "2rem", "paddingBottom": "4rem"})
 
     return html.Div([sidebar, content], style={"backgroundColor": "#f4f6f8", "minHeight": "100vh", "position": "absolute", "top": 0, "left": 0, "width": "100%"})
 
 app.layout = serve_layout
 
-@callback(Output('time-slider', 'value'), [Input('reset-time-btn', 'n_clicks')], [State('time-slider', 'value')])
-def reset_slider(n, c): 
-    return get_current_time_index() if ctx.triggered_id == 'reset-time-btn' else c
+app.clientside_callback(
+    """
+    function(n, c) {
+        if (!n) { return c; }
+        var now = new Date();
+        var idx = Math.round((now.getUTCHours() * 3600 + now.getUTCMinutes() * 60 + now.getUTCSeconds()) / 600);
+        return Math.max(0, Math.min(143, idx));
+    }
+    """,
+    Output('time-slider', 'value'), [Input('reset-time-btn', 'n_clicks')], [State('time-slider', 'value')]
+)
+
+app.clientside_callback(
+    """
+    function(time_index) {
+        var idx = Math.max(0, Math.min(143, time_index == null ? 0 : time_index));
+        var pad = function(v) { return (v < 10 ? '0' : '') + v; };
+        return pad(Math.floor(idx / 6)) + ':' + pad((idx % 6) * 10) + ' UTC';
+    }
+    """,
+    Output('time-display-sidebar', 'children'), [Input('time-slider', 'value')]
+)
+
+app.clientside_callback(
+    """
+    function(figures_json) {
+        var figures = JSON.parse(figures_json || '{}');
+        var empty = {data: [], layout: {}};
+        return [figures.owners || empty, figures.altitude || empty, figures.inclination || empty];
+    }
+    """,
+    [Output('owners-graph', 'figure'), Output('altitude-graph', 'figure'), Output('inclination-graph', 'figure')],
+    [Input('figures-store', 'data')]
+)
 
 @callback(
-    [Output('globe-map', 'figure'), Output('time-display-sidebar', 'children')], 
+    Output('globe-map', 'figure'), 
     [Input('time-slider', 'value'), Input('satellite-search', 'value')]
 )
 def update_map(time_index, search_name):
@@ -308,62 +414,29 @@ def update_map(time_index, search_name):
         load_data_smart()
     
     time_index = max(0, min(time_index, 143))
-    time_str = timestamps[time_index].strftime("%H:%M UTC")
+    return _build_figure(time_index, search_name)
 
+# entries share the load-time marker/hover arrays and layout, so each one only holds its lat/lon slices
+@functools.lru_cache(maxsize=256)
+def _build_figure(time_index, search_name):
     if search_name:
-        mask = (df_main['Object_Name'].astype(str) == str(search_name))
-        matching_indices = np.where(mask)[0]
-        
-        if len(matching_indices) > 0:
-            lats = _traj_lat[matching_indices, time_index].tolist()
-            lons = _traj_lon[matching_indices, time_index].tolist()
-            texts = [f"{search_name}"]
-            colors = ['#FFD700']
-            sizes = [20]
-            opacities = [1.0]
-        else:
-            lats, lons, texts, colors, sizes, opacities = [], [], [], [], [], []
+        rows = _name_to_rows.get(str(search_name), _NO_ROWS)
+        texts = str(search_name)
+        marker = SEARCH_MARKER
     else:
-        lats = _traj_lat[:, time_index].tolist()
-        lons = _traj_lon[:, time_index].tolist()
-        
-        orbit_values = df_main['Orbit'].astype(str).values
-        colors = []
-        for orbit in orbit_values:
-            if orbit == 'LEO':
-                colors.append('#10b981')
-            elif orbit == 'MEO':
-                colors.append('#3b82f6')
-            elif orbit == 'GEO':
-                colors.append('#ef4444')
-            else:
-                colors.append('#eab308')
-        
-        texts = (df_main['Object_Name'].astype(str) + ' (' + df_main['Owner'].astype(str) + ')').tolist()
-        sizes = [2] * len(lats)
-        opacities = [0.7] * len(lats)
-
-    fig = go.Figure(go.Scattergeo(
-        lon=lons, 
-        lat=lats, 
-        text=texts, 
-        mode='markers', 
-        marker=dict(size=sizes, color=colors, opacity=opacities)
-    ))
-    fig.update_layout(
-        geo=dict(
-            projection_type="orthographic", 
-            showland=True, landcolor="#111111", 
-            showocean=True, oceancolor="#222222", 
-            showcountries=True, countrycolor="#444444",
-            bgcolor="rgba(0,0,0,0)"
-        ), 
-        title=dict(text="<b>Globe Overview</b>", x=0.02, y=0.95, font=dict(color="black", size=20)),
-        margin={"r":0,"t":50,"l":0,"b":0}, 
-        paper_bgcolor="rgba(0,0,0,0)", 
-        template="plotly_dark"
-    )
-    return fig, time_str
+        rows = slice(None)
+        texts = _globe_hover
+        marker = _globe_marker
+
+    trace = {
+        'type': 'scattergeo', 
+        'mode': 'markers', 
+        'lon': dequantize_coords(_traj_lon[rows, time_index]), 
+        'lat': dequantize_coords(_traj_lat[rows, time_index]), 
+        'text': texts, 
+        'marker': marker
+    }
+    return {'data': [trace], 'layout': GLOBE_LAYOUT}
 
 if __name__ == '__main__':
     port = int(os.environ.get('PORT', 8050))